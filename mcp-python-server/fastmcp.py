@@ -4,8 +4,9 @@ The upstream `fastmcp` dependency is not available in the execution
 environment used for continuous integration.  The real package provides a
 Model Context Protocol (MCP) helper that exposes a `.tool()` decorator and a
 `.run()` entry point for serving registered tools.  For the purposes of our
-test-suite we only need to register callables so they can be imported from the
-`server` module; the networked serving functionality is not exercised.
+test-suite we only need the decorated callables to remain importable from the
+`server` module; recording them in ``FastMCP.tools`` is opt-in and the
+networked serving functionality is not exercised.
 
 This lightweight shim mirrors the handful of behaviours that the server module
 expects while remaining dependency free.  It keeps the public API compatible
@@ -14,19 +15,30 @@ remains trivial.
 """
 from __future__ import annotations
 
+import logging
+import os
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Optional
 
 ToolCallable = Callable[..., Any]
 
+_log = logging.getLogger(__name__)
 
-@dataclass
+# Registration bookkeeping is only useful when something inspects ``tools``.
+# Set ``FASTMCP_REGISTER_TOOLS`` to "1", "true" or "yes" (case-insensitive) to
+# opt in; any other value, or leaving it unset, keeps registration off.
+_REGISTER_TOOLS_ENV = "FASTMCP_REGISTER_TOOLS"
+_TRUTHY = ("1", "true", "yes")
+_REGISTER = os.environ.get(_REGISTER_TOOLS_ENV, "").lower() in _TRUTHY
+
+
+@dataclass(slots=True)
 class FastMCP:
-    """Drop-in stub that captures tool registrations.
+    """Drop-in stub with opt-in capture of tool registrations.
 
     The decorator simply returns the original function so the surrounding code
-    keeps working exactly the same way.  Registered tools are stored in the
-    ``tools`` dictionary for potential inspection during testing.
+    keeps working exactly the same way.  Registered tools are only stored in
+    the ``tools`` dictionary when ``FASTMCP_REGISTER_TOOLS`` enables it.
     """
 
     name: str
@@ -44,8 +56,8 @@ class FastMCP:
         """
 
         def decorator(func: ToolCallable) -> ToolCallable:
-            tool_name = name or func.__name__
-            self.tools[tool_name] = func
+            if _REGISTER:
+                self.tools[name or func.__name__] = func
             return func
 
         return decorator
@@ -54,6 +66,6 @@ class FastMCP:
     # not start the interactive server.  Providing a no-op ``run`` keeps the
     # API surface compatible with the real library while remaining safe to call
     # in environments where networking/event loops are undesirable.
-    def run(self) -> None:  # pragma: no cover - intentionally inert
+    def run(self) -> None:
         """Placeholder entry point to match the real ``FastMCP`` API."""
-        print(f"FastMCP stub '{self.name}' is running without network support.")
+        _log.info("FastMCP stub %r is running without network support.", self.name)
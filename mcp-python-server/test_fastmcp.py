@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Pytest test suite for the local FastMCP stub"""
+
+import importlib
+import logging
+import sys
+import os
+
+import pytest
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(__file__))
+
+import fastmcp
+
+
+def _sample():
+    return "ok"
+
+
+@pytest.fixture
+def reload_fastmcp(monkeypatch):
+    """Reload ``fastmcp`` after changing the env, restoring it afterwards"""
+
+    def _reload(value=None):
+        if value is None:
+            monkeypatch.delenv("FASTMCP_REGISTER_TOOLS", raising=False)
+        else:
+            monkeypatch.setenv("FASTMCP_REGISTER_TOOLS", value)
+        return importlib.reload(fastmcp)
+
+    yield _reload
+    monkeypatch.undo()
+    importlib.reload(fastmcp)
+
+
+class TestToolRegistration:
+    """Test the tool() decorator"""
+
+    def test_decorator_returns_function_unchanged(self):
+        """Test decorated function is returned as-is"""
+        mcp = fastmcp.FastMCP("x")
+        assert mcp.tool()(_sample) is _sample
+        assert _sample() == "ok"
+
+    def test_tools_empty_by_default(self, reload_fastmcp):
+        """Test registration is off when the env var is unset"""
+        module = reload_fastmcp()
+        mcp = module.FastMCP("x")
+        mcp.tool()(_sample)
+        assert mcp.tools == {}
+
+    def test_falsy_env_values_keep_registration_off(self, reload_fastmcp):
+        """Test values such as "0" or "false" do not enable registration"""
+        for value in ("0", "false", "no", ""):
+            module = reload_fastmcp(value)
+            assert module._REGISTER is False
+            mcp = module.FastMCP("x")
+            mcp.tool()(_sample)
+            assert mcp.tools == {}
+
+    def test_truthy_env_values_enable_registration(self, reload_fastmcp):
+        """Test the env var is parsed at import time, case-insensitively"""
+        for value in ("1", "True", "YES"):
+            assert reload_fastmcp(value)._REGISTER is True
+
+    def test_enabled_flag_registers_tools(self, monkeypatch):
+        """Test tools are recorded under their own or explicit names"""
+        monkeypatch.setattr(fastmcp, "_REGISTER", True)
+        mcp = fastmcp.FastMCP("x")
+        mcp.tool()(_sample)
+        mcp.tool(name="renamed")(_sample)
+        assert mcp.tools == {"_sample": _sample, "renamed": _sample}
+
+    def test_instance_has_no_dict(self):
+        """Test FastMCP uses slots instead of a per-instance __dict__"""
+        assert not hasattr(fastmcp.FastMCP("x"), "__dict__")
+
+
+class TestRun:
+    """Test the inert run() entry point"""
+
+    def test_run_logs_instead_of_printing(self, caplog, capsys):
+        """Test run() logs at INFO on the fastmcp logger and prints nothing"""
+        with caplog.at_level(logging.INFO, logger="fastmcp"):
+            fastmcp.FastMCP("demo").run()
+
+        assert capsys.readouterr().out == ""
+        records = [r for r in caplog.records if r.name == "fastmcp"]
+        assert len(records) == 1
+        record = records[0]
+        assert record.levelno == logging.INFO
+        assert record.args == ("demo",)
+        assert record.getMessage() == (
+            "FastMCP stub 'demo' is running without network support."
+        )